@@ -100,7 +100,7 @@ def get_bitcoind( new_bitcoind_opts=None, reset=False, new=False ):
 
       new_bitcoind = None
       try:
-         if bitcoin_opts.has_key('bitcoind_mock') and bitcoin_opts['bitcoind_mock']:
+         if 'bitcoind_mock' in bitcoin_opts and bitcoin_opts['bitcoind_mock']:
             # make a mock connection
             log.debug("Use mock bitcoind")
             import blockstack_integration_tests.mock_bitcoind
@@ -316,9 +316,25 @@ class BlockstackdRPC(SimpleXMLRPCServer):
         for attr in dir(self):
             if attr.startswith("rpc_"):
                 method = getattr(self, attr)
-                if callable(method) or hasattr(method, '__call__'):
+                if callable(method):
                     self.register_function( method )
 
+        # bitcoind connection, shared across requests
+        self.bitcoind = None
+
+
+    def get_bitcoind_session(self, reset=False):
+        """
+        Get this server's bitcoind connection, creating it if need be.
+        Requests are handled one at a time, so it is safe to reuse.
+        Return None if we could not connect.
+        """
+        if reset or self.bitcoind is None:
+            bitcoind_opts = blockstack_client.default_bitcoind_opts( virtualchain.get_config_filename(), prefix=True )
+            self.bitcoind = get_bitcoind( new_bitcoind_opts=bitcoind_opts, new=True )
+
+        return self.bitcoind
+
 
     def analytics(self, event_type, event_payload):
         """
@@ -327,7 +343,7 @@ class BlockstackdRPC(SimpleXMLRPCServer):
         """
         ak = None
         conf = get_blockstack_opts()
-        if conf.has_key('analytics_key'):
+        if 'analytics_key' in conf:
             ak = conf['analytics_key']
 
         if ak is None or len(ak) == 0:
@@ -429,11 +445,7 @@ class BlockstackdRPC(SimpleXMLRPCServer):
         db = get_state_engine()
 
         all_ops = db.get_all_nameops_at( block_id )
-        ret = []
-        for op in all_ops:
-            restored_op = nameop_restore_consensus_fields( op, block_id )
-            ret.append( restored_op )
-
+        ret = [ nameop_restore_consensus_fields( op, block_id ) for op in all_ops ]
         return ret
 
 
@@ -451,10 +463,7 @@ class BlockstackdRPC(SimpleXMLRPCServer):
         if ops is None:
             ops = []
 
-        restored_ops = []
-        for op in ops:
-            restored_op = nameop_restore_consensus_fields( op, block_id )
-            restored_ops.append( restored_op )
+        restored_ops = [ nameop_restore_consensus_fields( op, block_id ) for op in ops ]
 
         # NOTE: extracts only the operation-given fields, and ignores ancilliary record fields
         serialized_ops = [ virtualchain.StateEngine.serialize_op( str(op['op'][0]), op, BlockstackDB.make_opfields(), verbose=False ) for op in restored_ops ]
@@ -472,13 +481,21 @@ class BlockstackdRPC(SimpleXMLRPCServer):
         """
         Get the number of blocks the
         """
-        bitcoind_opts = blockstack_client.default_bitcoind_opts( virtualchain.get_config_filename(), prefix=True )
-        bitcoind = get_bitcoind( new_bitcoind_opts=bitcoind_opts, new=True )
-        
+        bitcoind = self.get_bitcoind_session()
         if bitcoind is None:
             return {'error': 'Internal server error: failed to connect to bitcoind'}
 
-        info = bitcoind.getinfo()
+        try:
+            info = bitcoind.getinfo()
+        except Exception, e:
+            # connection may have gone stale; reconnect once
+            log.exception(e)
+            bitcoind = self.get_bitcoind_session( reset=True )
+            if bitcoind is None:
+                return {'error': 'Internal server error: failed to connect to bitcoind'}
+
+            info = bitcoind.getinfo()
+
         reply = {}
         reply['bitcoind_blocks'] = info['blocks']       # legacy
         reply['blockchain_blocks'] = info['blocks']
@@ -1011,12 +1028,6 @@ class BlockstackdRPC(SimpleXMLRPCServer):
         
         else:
             log.warn("Falling back to verifying with owner address")
-            db = get_state_engine()
-            name_rec = db.get_name( name )
-            if name_rec is None:
-                log.debug("No such name")
-                return {'error': 'No such name'}
-
             owner_addr = name_rec.get('address', None)
             if owner_addr is None:
                 log.debug("No owner address")
@@ -1140,7 +1151,7 @@ class BlockstackdRPC(SimpleXMLRPCServer):
             return {'error': 'invalid uuid'}
 
         conf = get_blockstack_opts()
-        if not conf.has_key('analytics_key') or conf['analytics_key'] is None:
+        if 'analytics_key' not in conf or conf['analytics_key'] is None:
             return {'error': 'No analytics key'}
         
         log.debug("Give key to %s" % client_uuid)
@@ -1237,12 +1248,26 @@ def stop_server( clean=False, kill=False ):
         if kill:
             clean = True
             timeout = 5.0
-            log.info("Waiting %s seconds before sending SIGKILL to %s" % (timeout, pid))
-            time.sleep(timeout)
-            try:
-                os.kill(pid, signal.SIGKILL)
-            except Exception, e:
-                pass
+            log.info("Waiting up to %s seconds before sending SIGKILL to %s" % (timeout, pid))
+
+            # poll for exit, backing off to at most 1 second between checks
+            deadline = time.time() + timeout
+            delay = 0.1
+            exited = False
+            while not exited and time.time() < deadline:
+                time.sleep( min( delay, max( deadline - time.time(), 0 ) ) )
+                delay = min( delay * 2, 1.0 )
+                try:
+                    os.kill(pid, 0)
+                except OSError, oe:
+                    if oe.errno == errno.ESRCH:
+                        exited = True
+
+            if not exited:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except Exception, e:
+                    pass
    
     if clean:
         # always blow away the pid file 
@@ -1490,24 +1515,18 @@ def semver_match( v1, v2):
     Verify that two semantic version strings match:
     the major, minor, and patch versions must be equal.
     """
+    if v1 == v2:
+        # common case: config file written by this version
+        return v1.count(".") >= 3
+
     v1_parts = v1.split(".")
     v2_parts = v2.split(".")
     if len(v1_parts) < 4 or len(v2_parts) < 4:
         # one isn't a semantic version 
         return False
 
-    v1_major, v1_minor, v1_patch, v1_features = v1_parts[0], v1_parts[1], v1_parts[2], v1_parts[3:]
-    v2_major, v2_minor, v2_patch, v2_features = v2_parts[0], v2_parts[1], v2_parts[2], v2_parts[3:]
-    if v1_major != v2_major:
-        return False
-
-    if v1_minor != v2_minor:
-        return False
-
-    if v1_patch != v2_patch:
-        return False
-
-    return True
+    # major, minor, and patch
+    return v1_parts[:3] == v2_parts[:3]
 
 
 def setup( working_dir=None, return_parser=False ):
@@ -1542,7 +1561,8 @@ def setup( working_dir=None, return_parser=False ):
        print >> sys.stderr, "Obsolete config file (%s).\nPlease move it out of the way, so Blockstack Server can generate a fresh one." % virtualchain.get_config_filename()
        return None
 
-   log.debug("config:\n%s" % json.dumps(opts, sort_keys=True, indent=4))
+   if log.isEnabledFor( logging.DEBUG ):
+       log.debug("config:\n%s" % json.dumps(opts, sort_keys=True, indent=4))
 
    # merge in command-line bitcoind options
    config_file = virtualchain.get_config_filename()
@@ -1633,7 +1653,7 @@ def rec_to_virtualchain_op( name_rec, block_number, history_index, untrusted_db
     opcode_name = str(name_rec['opcode'])
     ret_op = {}
 
-    if name_rec.has_key('expired') and name_rec['expired']:
+    if 'expired' in name_rec and name_rec['expired']:
         # don't care
         return None
 
@@ -1805,7 +1825,7 @@ def find_last_transfer_consensus_hash( name_rec, block_id, vtxindex ):
                 # out of history
                 return None
 
-            if history_state.has_key('consensus_hash') and history_state['consensus_hash'] is not None:
+            if 'consensus_hash' in history_state and history_state['consensus_hash'] is not None:
                 return history_state['consensus_hash']
 
     return None
@@ -1927,11 +1947,12 @@ def block_to_virtualchain_ops( block_id, db ):
             continue
 
         name = str(nameop['name'])
-        if name not in history_index.keys():
+        if name not in history_index:
             history_index[name] = { i: 0 }
 
         else:
-            history_index[name][i] = max( history_index[name].values() ) + 1
+            # indexes are handed out as 0, 1, 2, ..., so the next one is the count so far
+            history_index[name][i] = len( history_index[name] )
 
 
     for i in xrange(0, len(nameops)):
@@ -2121,11 +2142,24 @@ def check_alternate_working_dir():
     return path
 
 
+def print_version_and_exit():
+   """
+   Print the version and exit
+   """
+   print "Blockstack version: %s" % VERSION
+   sys.exit(0)
+
+
 def run_blockstackd():
    """
    run blockstackd
    """
 
+   # no need to load the config file or set up virtualchain
+   # just to print the version
+   if len(sys.argv) == 2 and sys.argv[1] == 'version':
+      print_version_and_exit()
+
    working_dir = check_alternate_working_dir()
    blockstack_state_engine.working_dir = working_dir
    argparser = setup( working_dir=working_dir, return_parser=True )
@@ -2233,8 +2267,7 @@ def run_blockstackd():
    args, _ = argparser.parse_known_args()
 
    if args.action == 'version':
-      print "Blockstack version: %s" % VERSION
-      sys.exit(0)
+      print_version_and_exit()
 
    if args.action == 'start':
 
@@ -379,7 +379,7 @@ def store_announcement( announcement_hash, announcement_text, working_dir=None,
    # filter
    if not force:
        announcement_list = announce_text.split("\n")
-       unseen_announcements = filter( lambda a: a not in ANNOUNCEMENTS, announcement_list )
+       unseen_announcements = [ a for a in announcement_list if a not in ANNOUNCEMENTS ]
        announce_text = "\n".join( unseen_announcements ).strip() + "\n"
 
    log.debug("Store announcement hash to %s" % announce_filename )
@@ -706,7 +706,7 @@ def configure( config_file=None, force=False, interactive=True ):
    
        # always set version when writing
        config_opts = copy.deepcopy(ret)
-       if not config_opts['blockstack'].has_key('server_version'):
+       if 'server_version' not in config_opts['blockstack']:
            config_opts['blockstack']['server_version'] = VERSION
 
        # if the config file doesn't exist, then set the version 
@@ -21,6 +21,8 @@
     along with Blockstack. If not, see <http://www.gnu.org/licenses/>.
 """
 
+import hashlib
+
 from utilitybelt import dev_urandom_entropy, is_hex
 from binascii import hexlify, unhexlify
 from pybitcoin.hash import hex_hash160, bin_hash160, bin_sha256, bin_double_sha256, hex_to_bin_reversed, bin_to_hex_reversed
@@ -46,5 +48,5 @@ def hash256_trunc128( data ):
    """
    Hash a string of data by taking its 256-bit sha256 and truncating it to 128 bits.
    """
-   return hexlify( bin_sha256( data )[0:16] )
+   return hexlify( hashlib.sha256( data ).digest()[0:16] )
    
\ No newline at end of file
@@ -52,6 +52,10 @@ log = virtualchain.get_logger("blockstack-log")
 DISPOSITION_RO = "readonly"
 DISPOSITION_RW = "readwrite"
 
+# characters that determine a name's price discounts (see price_name)
+NAME_VOWEL_CHARS = ("a", "e", "i", "o", "u", "y")
+NAME_NONALPHA_CHARS = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "-", "_")
+
 
 class BlockstackDB( virtualchain.StateEngine ):
    """
@@ -166,13 +170,13 @@ class BlockstackDB( virtualchain.StateEngine ):
          expires = name_record['last_renewed'] + namespace['lifetime']
 
          # build expiration dates
-         if not self.block_name_expires.has_key( expires ):
+         if expires not in self.block_name_expires:
              self.block_name_expires[ expires ] = [name]
          else:
              self.block_name_expires[ expires ].append( name )
 
          # build sender --> names
-         if not self.owner_names.has_key( name_record['sender'] ):
+         if name_record['sender'] not in self.owner_names:
              self.owner_names[ name_record['sender'] ] = [name]
          else:
              self.owner_names[ name_record['sender'] ].append( name )
@@ -181,8 +185,8 @@ class BlockstackDB( virtualchain.StateEngine ):
          self.hash_names[ hash256_trunc128( name ) ] = name
 
          # build address --> names
-         if name_record.has_key('address'):
-             if not self.address_names.has_key( name_record['address'] ):
+         if 'address' in name_record:
+             if name_record['address'] not in self.address_names:
                  self.address_names[ name_record['address'] ] = [name]
              else:
                  self.address_names[ name_record['address'] ].append( name )
@@ -210,7 +214,7 @@ class BlockstackDB( virtualchain.StateEngine ):
              if not name.endswith( namespace_id ):
                  continue
 
-             if not name_record.has_key('sender_pubkey'):
+             if 'sender_pubkey' not in name_record:
                  continue
 
              pubkey_hex = name_record['sender_pubkey']
@@ -493,7 +497,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       Only valid if the name was sent by a p2pkh script.
       """
 
-      if self.address_names.has_key( address ):
+      if address in self.address_names:
           return self.address_names[address]
       else:
           return None
@@ -583,17 +587,15 @@ class BlockstackDB( virtualchain.StateEngine ):
       if offset < 0:
          raise Exception("Invalid offset %s" % offset)
 
-      if offset >= len(self.name_records.keys()):
+      if offset >= len(self.name_records):
          return []
 
       names = []
       if count is None:
-         names = self.name_records.keys()[:]
-         names.sort()
+         names = sorted(self.name_records)
 
       else:
-         names = sorted(self.name_records.keys())[offset:min(offset+count, len(self.name_records.keys()))]
-         names.sort()
+         names = sorted(self.name_records)[offset:offset+count]
 
       #return dict( zip( names, [self.name_records[name] for name in names] ) )
       return names
@@ -611,11 +613,10 @@ class BlockstackDB( virtualchain.StateEngine ):
       if offset < 0:
           raise Exception("Invalid offset %s" % offset)
 
-      if offset >= len(self.name_records.keys()):
+      if offset >= len(self.name_records):
           return []
 
-      all_names = self.name_records.keys()[:]
-      all_names.sort()
+      all_names = sorted(self.name_records)
 
       namespace_names = []
 
@@ -815,20 +816,21 @@ class BlockstackDB( virtualchain.StateEngine ):
       Omit expired or revoked names.
       """
       ret = []
-      for name in self.name_records.keys():
+      for (name, rec) in self.name_records.items():
 
-          rec = self.name_records[name]
+          # cheapest check first
+          if 'value_hash' not in rec or rec['value_hash'] != value_hash:
+              continue
 
           # revoked?
-          if rec.has_key('revoked') and rec['revoked']:
-              continue 
+          if 'revoked' in rec and rec['revoked']:
+              continue
 
           # expired?
           if self.is_name_expired( rec['name'], self.lastblock ):
               continue
 
-          if rec.has_key('value_hash') and rec['value_hash'] == value_hash:
-              ret.append(rec['name'])
+          ret.append(rec['name'])
 
       if len(ret) == 0:
           return None
@@ -863,7 +865,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       if rec is None:
           return None 
 
-      if rec.has_key('revoked') and rec['revoked']:
+      if 'revoked' in rec and rec['revoked']:
           return None 
 
       if self.is_name_expired(rec['name'], self.lastblock ):
@@ -879,11 +881,11 @@ class BlockstackDB( virtualchain.StateEngine ):
 
       for i in xrange(len(flat_hist)-1, 0, -1):
            delta = flat_hist[i]
-           if delta.has_key('op') and delta['op'] == NAME_PREORDER:
+           if 'op' in delta and delta['op'] == NAME_PREORDER:
                 # this name was re-registered. skip
                 return None 
 
-           if delta.has_key('value_hash') and delta['value_hash'] == value_hash:
+           if 'value_hash' in delta and delta['value_hash'] == value_hash:
                 # this is the txid that affected it 
                 return delta['txid']
 
@@ -910,7 +912,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       if name not in self.name_records.keys():
           return False
 
-      if self.name_records[name].has_key('revoked') and self.name_records[name]['revoked']:
+      if 'revoked' in self.name_records[name] and self.name_records[name]['revoked']:
           return False
 
       if self.is_name_expired( name, self.lastblock ):
@@ -1060,7 +1062,7 @@ class BlockstackDB( virtualchain.StateEngine ):
 
           for diff in diff_list:
 
-              if diff.has_key('history_snapshot'):
+              if 'history_snapshot' in diff:
                   # wholly new state
                   historical_rec = copy.deepcopy( diff )
                   del historical_rec['history_snapshot']
@@ -1068,7 +1070,7 @@ class BlockstackDB( virtualchain.StateEngine ):
               else:
                   # delta in current state
                   # no matter what, 'block_number' cannot be altered (unless it's a history snapshot)
-                  if diff.has_key('block_number'):
+                  if 'block_number' in diff:
                       del diff['block_number']
 
                   historical_rec.update( diff )
@@ -1093,10 +1095,10 @@ class BlockstackDB( virtualchain.StateEngine ):
               for diff in diff_list[:-1]:
 
                   # no matter what, 'block_number' cannot be altered
-                  if diff.has_key('block_number'):
+                  if 'block_number' in diff:
                       del diff['block_number']
 
-                  if diff.has_key('history_snapshot'):
+                  if 'history_snapshot' in diff:
                       # wholly new state
                       historical_rec = copy.deepcopy( diff )
                       del historical_rec['history_snapshot']
@@ -1126,10 +1128,10 @@ class BlockstackDB( virtualchain.StateEngine ):
           if field in rec:
               diff_rec[field] = copy.deepcopy( rec[field] )
 
-      if not rec.has_key('history'):
+      if 'history' not in rec:
           rec['history'] = {}
 
-      if rec['history'].has_key( block_id ):
+      if block_id in rec['history']:
           rec['history'][block_id].append( diff_rec )
 
       else:
@@ -1145,7 +1147,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       so we can later reconstruct the name at a particular block ID.
       """
 
-      if not self.name_records.has_key(name):
+      if name not in self.name_records:
           return False
 
       self.name_records[name] = BlockstackDB.save_diff( self.name_records[name], block_id, field_list )
@@ -1163,7 +1165,7 @@ class BlockstackDB( virtualchain.StateEngine ):
 
       owner = None
 
-      if not self.name_records.has_key( name ):
+      if name not in self.name_records:
          return False
 
       # anyone can claim the name now
@@ -1173,17 +1175,17 @@ class BlockstackDB( virtualchain.StateEngine ):
       address = self.name_records[name].get('address', None)
 
       # update secondary indexes
-      if owner is not None and self.owner_names.has_key( owner ) and name in self.owner_names[owner]:
+      if owner is not None and owner in self.owner_names and name in self.owner_names[owner]:
          self.owner_names[ owner ].remove( name )
          if len(self.owner_names[owner]) == 0:
              del self.owner_names[owner]
 
-      if address is not None and self.address_names.has_key( address ) and name in self.address_names[address]:
+      if address is not None and address in self.address_names and name in self.address_names[address]:
          self.address_names[ address ].remove( name )
          if len(self.address_names[address]) == 0:
              del self.address_names[address]
 
-      if self.hash_names.has_key( name_hash ):
+      if name_hash in self.hash_names:
          del self.hash_names[ name_hash ]
 
       return True
@@ -1291,7 +1293,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       except ValueError:
          return None
       else:
-         if self.preorders.has_key(name_hash):
+         if name_hash in self.preorders:
             old_preorder = self.preorders[name_hash]
             del self.preorders[name_hash]
             return old_preorder
@@ -1307,16 +1309,16 @@ class BlockstackDB( virtualchain.StateEngine ):
       (i.e. call this on a NAMESPACE_READY commit).
       """
 
-      if self.namespace_preorders.has_key( namespace_id_hash ):
+      if namespace_id_hash in self.namespace_preorders:
           del self.namespace_preorders[ namespace_id_hash ]
 
-      if self.namespace_reveals.has_key( namespace_id ):
+      if namespace_id in self.namespace_reveals:
           del self.namespace_reveals[ namespace_id ]
 
-      if self.namespace_id_to_hash.has_key( namespace_id ):
+      if namespace_id in self.namespace_id_to_hash:
           del self.namespace_id_to_hash[ namespace_id ]
 
-      if self.import_addresses.has_key( namespace_id ):
+      if namespace_id in self.import_addresses:
           del self.import_addresses[ namespace_id ]
 
       return
@@ -1454,7 +1456,7 @@ class BlockstackDB( virtualchain.StateEngine ):
           self.address_names[ recipient_address ].append( str(name) )
           self.hash_names[ hash256_trunc128( name ) ] = name
 
-          if not self.block_name_expires.has_key( expires ):
+          if expires not in self.block_name_expires:
               self.block_name_expires[ expires ] = [name]
           else:
               self.block_name_expires[ expires ].append( name )
@@ -1483,11 +1485,11 @@ class BlockstackDB( virtualchain.StateEngine ):
       expires = current_block_number + namespace['lifetime']
 
       # name no longer expires at the current expiry time
-      if self.block_name_expires.has_key( old_expires ):
+      if old_expires in self.block_name_expires:
           if name in self.block_name_expires[ old_expires ]:
               self.block_name_expires[ old_expires ].remove( name )
 
-      if not self.block_name_expires.has_key( expires ):
+      if expires not in self.block_name_expires:
           self.block_name_expires[ expires ] = [name]
       else:
           self.block_name_expires[ expires ].append( name )
@@ -1501,7 +1503,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       self.name_records[name]['vtxindex'] = nameop['vtxindex']
       self.name_records[name]['op'] = op
       self.name_records[name]['opcode'] = nameop['opcode']
-      if self.name_records.has_key('consensus_hash'):
+      if 'consensus_hash' in self.name_records:
           del self.name_records['consensus_hash']
 
       # propagate information back to virtualchian for snapshotting
@@ -1590,12 +1592,12 @@ class BlockstackDB( virtualchain.StateEngine ):
          self.name_records[name]['value_hash'] = None
 
       # update secondary indexes
-      if self.owner_names.has_key(sender) and name in self.owner_names[sender]:
+      if sender in self.owner_names and name in self.owner_names[sender]:
           self.owner_names[sender].remove( name )
           if len(self.owner_names[sender]) == 0:
               del self.owner_names[sender]
 
-      if self.address_names.has_key(address) and name in self.address_names[address]:
+      if address in self.address_names and name in self.address_names[address]:
           self.address_names[address].remove( name )
           if len(self.address_names[address]) == 0:
               del self.address_names[address]
@@ -1632,12 +1634,12 @@ class BlockstackDB( virtualchain.StateEngine ):
       self.name_records[name]['value_hash'] = None
 
       # update secondary indexes
-      if self.owner_names.has_key( sender ) and name in self.owner_names[sender]:
+      if sender in self.owner_names and name in self.owner_names[sender]:
           self.owner_names[sender].remove( name )
           if len(self.owner_names[sender]) == 0:
               del self.owner_names[sender]
 
-      if self.address_names.has_key( address ) and name in self.address_names[address]:
+      if address in self.address_names and name in self.address_names[address]:
           self.address_names[address].remove( name )
           if len(self.address_names[address]) == 0:
               del self.address_names[address]
@@ -1672,7 +1674,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       old_recipient = None
       old_recipient_address = None
 
-      if self.name_records.has_key( name ):
+      if name in self.name_records:
 
           name_rec_fields = [
             'value_hash',
@@ -1752,14 +1754,14 @@ class BlockstackDB( virtualchain.StateEngine ):
       # update secondary indexes...
       self.owner_names[ recipient ].append( str(name) )
       if old_recipient is not None:
-          if self.owner_names.has_key( old_recipient ) and name in self.owner_names[old_recipient]:
+          if old_recipient in self.owner_names and name in self.owner_names[old_recipient]:
               self.owner_names[ old_recipient ].remove( name )
               if len(self.owner_names[old_recipient]) == 0:
                   del self.owner_names[old_recipient]
 
       self.address_names[ recipient_address ].append( str(name) )
       if old_recipient_address is not None:
-          if self.address_names.has_key( old_recipient_address ) and name in self.address_names[old_recipient_address]:
+          if old_recipient_address in self.address_names and name in self.address_names[old_recipient_address]:
               self.address_names[ old_recipient_address ].remove( name )
               if len(self.address_names[old_recipient_address]) == 0:
                   del self.address_names[old_recipient_address]
@@ -1767,7 +1769,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       self.hash_names[ hash256_trunc128( name ) ] = name
 
       expires = current_block_number + namespace['lifetime']
-      if not self.block_name_expires.has_key( expires ):
+      if expires not in self.block_name_expires:
           self.block_name_expires[ expires ] = [name]
       else:
           self.block_name_expires[ expires ].append( name )
@@ -1869,7 +1871,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       namespace_reveal = self.sanitize_op( namespace_reveal )
       namespace_reveal['history_snapshot'] = True
 
-      if history.has_key( block_number ):
+      if block_number in history:
           history[block_number].append( namespace_reveal )
       else:
           history[block_number] = [namespace_reveal]
@@ -1918,7 +1920,7 @@ class BlockstackDB( virtualchain.StateEngine ):
 
               valid = self.log_registration( pending_ops, nameop, block_id )
               if valid:
-                  if nameop['name'] in valid_registrations.keys():
+                  if nameop['name'] in valid_registrations:
 
                       # mark all as collided
                       valid_registrations[nameop['name']].append( i )
@@ -1937,7 +1939,7 @@ class BlockstackDB( virtualchain.StateEngine ):
 
               valid = self.log_namespace_reveal( pending_ops, nameop, block_id )
               if valid:
-                  if nameop['namespace_id'] in valid_namespaces.keys():
+                  if nameop['namespace_id'] in valid_namespaces:
 
                       # mark all as collided
                       valid_namespaces[nameop['namespace_id']].append( i )
@@ -2124,7 +2126,7 @@ class BlockstackDB( virtualchain.StateEngine ):
              return False
 
           # name can't be registered if it was reordered before its namespace was ready
-          if not namespace.has_key('ready_block') or name_preorder['block_number'] < namespace['ready_block']:
+          if 'ready_block' not in namespace or name_preorder['block_number'] < namespace['ready_block']:
              log.debug("Name '%s' preordered before namespace '%s' was ready" % (name, namespace_id))
              return False
 
@@ -2262,7 +2264,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       """
 
       # compatibility for 0.13 and 0.14 w.r.t. multisig 
-      if not nameop.has_key('recipient_address'):
+      if 'recipient_address' not in nameop:
          log.debug("Missing or invalid recipient address")
          return False
 
@@ -2411,7 +2413,7 @@ class BlockstackDB( virtualchain.StateEngine ):
       sender = str(nameop['sender'])
       sender_pubkey = None
 
-      if not nameop.has_key('sender_pubkey'):
+      if 'sender_pubkey' not in nameop:
          log.debug("Name import requires a sender_pubkey (i.e. use of a p2pkh transaction)")
          return False
 
@@ -2518,15 +2520,15 @@ class BlockstackDB( virtualchain.StateEngine ):
       sender = nameop['sender']
       namespace_preorder = None
 
-      if not nameop.has_key('sender_pubkey'):
+      if 'sender_pubkey' not in nameop:
          log.debug("Namespace reveal requires a sender_pubkey (i.e. a p2pkh transaction)")
          return False
 
-      if not nameop.has_key('recipient'):
+      if 'recipient' not in nameop:
          log.debug("No recipient p2kh for namespace '%s'" % namespace_id)
          return False
 
-      if not nameop.has_key('recipient_address'):
+      if 'recipient_address' not in nameop:
          log.debug("No recipient_address for namespace '%s'" % namespace_id)
          return False
 
@@ -2661,13 +2663,15 @@ def price_name( name, namespace ):
    else:
        bucket_exponent = buckets[-1]
 
+   lower_name = name.lower()
+
    # no vowel discount?
-   if sum( [name.lower().count(v) for v in ["a", "e", "i", "o", "u", "y"]] ) == 0:
+   if sum( lower_name.count(v) for v in NAME_VOWEL_CHARS ) == 0:
        # no vowels!
        discount = max( discount, namespace['no_vowel_discount'] )
 
    # non-alpha discount?
-   if sum( [name.lower().count(v) for v in ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "-", "_"]] ) > 0:
+   if sum( lower_name.count(v) for v in NAME_NONALPHA_CHARS ) > 0:
        # non-alpha!
        discount = max( discount, namespace['nonalpha_discount'] )
 
@@ -32,6 +32,7 @@ import traceback
 import json
 import threading
 import copy
+import logging
 
 from .namedb import BlockstackDB, DISPOSITION_RO, DISPOSITION_RW
 
@@ -519,10 +520,10 @@ def db_check( block_id, checked_ops, opcode, op, txid, vtxindex, to_commit_sanit
          return False 
       
       # propagate txid and vtxindex data
-      if not op.has_key('txid'):
+      if 'txid' not in op:
           op['txid'] = str(txid)
      
-      if not op.has_key('vtxindex'):
+      if 'vtxindex' not in op:
           op['vtxindex'] = vtxindex
 
       # check op for correctness
@@ -576,15 +577,17 @@ def db_check( block_id, checked_ops, opcode, op, txid, vtxindex, to_commit_sanit
          # we do not process ANNOUNCEs, since they won't be fed into the consensus hash
          return False 
 
-      debug_op = copy.deepcopy( op )
-      if debug_op.has_key('history'):
-         del debug_op['history']
+      if log.isEnabledFor( logging.DEBUG ):
+         # shallow copy is enough; we only drop the (large) history
+         debug_op = copy.copy( op )
+         if 'history' in debug_op:
+            del debug_op['history']
 
-      if rc:
-         log.debug("ACCEPT op '%s' (%s)" % (opcode, json.dumps(debug_op, sort_keys=True)))
+         if rc:
+            log.debug("ACCEPT op '%s' (%s)" % (opcode, json.dumps(debug_op, sort_keys=True)))
 
-      else:
-         log.debug("REJECT op '%s' (%s)" % (opcode, json.dumps(debug_op, sort_keys=True)))
+         else:
+            log.debug("REJECT op '%s' (%s)" % (opcode, json.dumps(debug_op, sort_keys=True)))
          
       return rc
    
@@ -617,10 +620,10 @@ def db_commit( block_id, opcode, op, txid, vtxindex, db_state=None ):
 
         # committing an operation
         # pass along tx info
-        if not op.has_key('txid') and txid is not None:
+        if 'txid' not in op and txid is not None:
             op['txid'] = txid
 
-        if not op.has_key('vtxindex') and vtxindex is not None:
+        if 'vtxindex' not in op and vtxindex is not None:
             op['vtxindex'] = vtxindex
             
         if opcode == NAME_PREORDER:
@@ -650,10 +653,10 @@ def db_commit( block_id, opcode, op, txid, vtxindex, db_state=None ):
         elif opcode == NAMESPACE_READY:
             new_namerec = db.commit_namespace_ready( op, block_id )
      
-        if new_namerec:
+        if new_namerec and log.isEnabledFor( logging.DEBUG ):
             
-            debug_op = copy.deepcopy( op )
-            if debug_op.has_key('history'):
+            debug_op = copy.copy( op )
+            if 'history' in debug_op:
                 del debug_op['history']
 
             log.debug("COMMIT op '%s' (%s)" % (opcode, json.dumps(debug_op, sort_keys=True)))
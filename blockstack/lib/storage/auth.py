@@ -21,9 +21,6 @@
     along with Blockstack. If not, see <http://www.gnu.org/licenses/>.
 """
 
-import os
-import sys
-import json
 import blockstack_zones
 
 import blockstack_client
@@ -22,11 +22,6 @@
 """
 
 import os
-import json
-import sys
-import urllib2
-import stat
-import time
 
 from ..config import *
 from ..nameset import *
@@ -127,7 +122,7 @@ def get_zonefile_from_peers( zonefile_hash, peers ):
             zonefile_data = None
             continue
 
-        if not zonefile_data['zonefiles'].has_key(zonefile_hash):
+        if zonefile_hash not in zonefile_data['zonefiles']:
             # nope
             log.debug("Peer %s:%s did not return %s" % zonefile_hash)
             zonefile_data = None
@@ -196,6 +191,18 @@ def store_cached_zonefile( zonefile_dict, zonefile_dir=None ):
         os.makedirs(zonefile_dir_path)
 
     zonefile_path = os.path.join(zonefile_dir_path, "zonefile.txt")
+
+    # skip the rewrite if the stored file already has exactly this content;
+    # otherwise (missing, truncated, or corrupt) overwrite it below
+    if os.path.exists(zonefile_path):
+        try:
+            with open( zonefile_path, "r" ) as f:
+                if f.read() == zonefile_data:
+                    return True
+
+        except Exception, e:
+            log.debug("Failed to read cached zonefile %s; rewriting" % zonefile_path)
+
     try:
         with open( zonefile_path, "w" ) as f:
             f.write(zonefile_data)
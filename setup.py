@@ -21,7 +21,7 @@
     along with Blockstack. If not, see <http://www.gnu.org/licenses/>.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 exec(open("blockstack/version.py").read())
 
@@ -34,7 +34,13 @@ setup(
     author_email='support@blockstack.org',
     description='Name registrations on the Bitcoin blockchain with external storage',
     keywords='blockchain bitcoin btc cryptocurrency name key value store data',
-    packages=find_packages(),
+    packages=[
+        'blockstack',
+        'blockstack.lib',
+        'blockstack.lib.nameset',
+        'blockstack.lib.operations',
+        'blockstack.lib.storage'
+    ],
     scripts=['bin/blockstack-server'],
     download_url='https://github.com/blockstack/blockstore/archive/master.zip',
     zip_safe=False,